@@ -236,11 +236,11 @@ class DatabaseManager:
         try:
             import firebase_admin
             from firebase_admin import credentials, firestore
-            
+
             # Initialize Firebase
             cred = credentials.Certificate(self.credentials_path)
             firebase_admin.initialize_app(cred)
-            
+
             # Get Firestore client
             self.db = firestore.client()
             
@@ -4,11 +4,153 @@ Handles miner status reports from multiple validators with conflict resolution
 """
 
 import asyncio
-from datetime import datetime, timedelta
+import hashlib
+import logging
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from firebase_admin import firestore
-import statistics
+from cachetools import TTLCache
+import numpy as np
+
+# Use Numba-compiled consensus kernels if available
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator when numba is not installed"""
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+    NUMBA_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Field sets used by validator confidence scoring
+REQUIRED_STATUS_FIELDS = frozenset({'uid', 'hotkey', 'stake', 'is_serving'})
+DETAILED_STATUS_FIELDS = frozenset({'performance_score', 'current_load', 'task_type_specialization'})
+
+# Numeric miner-status fields aggregated by weighted average
+NUMERIC_CONSENSUS_FIELDS = ('stake', 'performance_score', 'current_load')
+
+# Sentinel marking a field absent from a report's status dict
+_MISSING = object()
+
+
+@njit(cache=True, fastmath=True)
+def _weighted_average_kernel(values, weights):
+    """Weighted average of a float64 column (plain mean if weights sum to 0)"""
+    total_weight = 0.0
+    weighted_sum = 0.0
+    for i in range(values.shape[0]):
+        total_weight += weights[i]
+        weighted_sum += values[i] * weights[i]
+
+    if total_weight == 0.0:
+        plain_sum = 0.0
+        for i in range(values.shape[0]):
+            plain_sum += values[i]
+        return plain_sum / values.shape[0]
+
+    return weighted_sum / total_weight
+
+
+@njit(cache=True)
+def _majority_vote_kernel(codes, weights, threshold_ratio):
+    """
+    Weighted majority vote over integer value codes.
+
+    Returns (winning_code, conflict_flag). Uses a linear scan instead of a
+    hashmap because value cardinality is tiny (booleans, a handful of hotkeys).
+    """
+    n = codes.shape[0]
+    total_weight = 0.0
+    for i in range(n):
+        total_weight += weights[i]
+    threshold = total_weight * threshold_ratio
+
+    for i in range(n):
+        code = codes[i]
+
+        # Only tally each distinct code once
+        seen_before = False
+        for j in range(i):
+            if codes[j] == code:
+                seen_before = True
+                break
+        if seen_before:
+            continue
+
+        code_weight = 0.0
+        for j in range(n):
+            if codes[j] == code:
+                code_weight += weights[j]
+        if code_weight >= threshold:
+            return code, False
+
+    # No clear majority - conflict detected, fall back to first value
+    return codes[0], True
+
+
+@njit(cache=True)
+def _nan_weighted_columns_kernel(values, weights):
+    """
+    Per-column weighted average of a dense (reports x fields) matrix.
+
+    NaN entries mark fields missing from a report and are skipped; a column
+    whose weights sum to zero falls back to the plain mean. No fastmath here -
+    it would license the compiler to drop the isnan checks.
+    """
+    n_rows, n_cols = values.shape
+    out = np.full(n_cols, np.nan)
+    for c in range(n_cols):
+        total_weight = 0.0
+        weighted_sum = 0.0
+        plain_sum = 0.0
+        count = 0
+        for r in range(n_rows):
+            v = values[r, c]
+            if np.isnan(v):
+                continue
+            total_weight += weights[r]
+            weighted_sum += v * weights[r]
+            plain_sum += v
+            count += 1
+        if count == 0:
+            continue
+        if total_weight == 0.0:
+            out[c] = plain_sum / count
+        else:
+            out[c] = weighted_sum / total_weight
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _overall_confidence_kernel(confidence_scores, unique_validators):
+    """Average report confidence plus a capped multi-validator bonus"""
+    avg_confidence = 0.0
+    for i in range(confidence_scores.shape[0]):
+        avg_confidence += confidence_scores[i]
+    avg_confidence /= confidence_scores.shape[0]
+
+    validator_bonus = unique_validators * 0.1
+    if validator_bonus > 0.2:
+        validator_bonus = 0.2
+
+    overall = avg_confidence + validator_bonus
+    if overall > 1.0:
+        overall = 1.0
+    return overall
+
+
+def _status_content_hash(miner_status: Dict[str, Any]) -> str:
+    """Stable digest of a miner status dict, independent of key order"""
+    canonical = repr(sorted(miner_status.items()))
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
 
 @dataclass
 class ValidatorReport:
@@ -19,7 +161,12 @@ class ValidatorReport:
     epoch: int
     miner_status: Dict[str, Any]
     confidence_score: float = 1.0  # Validator's confidence in this report
-    
+    content_hash: Optional[str] = None  # Digest of miner_status for change detection
+
+    def __post_init__(self):
+        if self.content_hash is None:
+            self.content_hash = _status_content_hash(self.miner_status)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             'validator_uid': self.validator_uid,
@@ -27,7 +174,8 @@ class ValidatorReport:
             'timestamp': self.timestamp,
             'epoch': self.epoch,
             'miner_status': self.miner_status,
-            'confidence_score': self.confidence_score
+            'confidence_score': self.confidence_score,
+            'content_hash': self.content_hash
         }
 
 @dataclass
@@ -68,10 +216,30 @@ class MultiValidatorManager:
         self.consensus_timeout = timedelta(minutes=5)  # Time to wait for consensus
         self.max_conflict_threshold = 0.3  # Maximum allowed conflict ratio
         
-        # In-memory cache for performance
-        self.consensus_cache = {}
-        self.last_cache_update = datetime.now()
+        # Firestore write batches are limited to 500 operations
+        self.max_batch_ops = 500
+
+        # Coalesced consensus recomputation - incoming reports mark miners
+        # dirty and a single background worker recomputes once per burst
+        self.consensus_debounce_seconds = 0.5
+        self._dirty_miners = set()
+        self._dirty_event = asyncio.Event()
+        self._consensus_worker_task = None
+
+        # Doc ID -> content hash of the last committed write, for
+        # short-circuiting retried (validator, miner, epoch) submissions whose
+        # content matches what is already stored; reset per epoch
+        self._seen_reports = {}
+        self._seen_reports_epoch = None
+
+        # Digest of the report set behind each miner's last stored consensus,
+        # so recomputation is skipped when nothing actually changed
+        self._consensus_input_hash = {}
+
+        # In-memory cache for performance - bounded LRU with per-entry TTL,
+        # so one miner's expiry no longer invalidates every other entry
         self.cache_ttl = timedelta(minutes=1)
+        self.consensus_cache = TTLCache(maxsize=10000, ttl=self.cache_ttl.total_seconds())
     
     async def receive_validator_report(self, validator_uid: int, miner_statuses: List[Dict], epoch: int) -> Dict[str, Any]:
         """
@@ -86,48 +254,99 @@ class MultiValidatorManager:
             Dict with processing results
         """
         try:
-            print(f"📥 Processing miner status report from validator {validator_uid}")
-            print(f"   Miners reported: {len(miner_statuses)}")
-            print(f"   Epoch: {epoch}")
+            logger.info("📥 Processing report from validator %s: %d miners, epoch %s",
+                        validator_uid, len(miner_statuses), epoch)
             
             processed_count = 0
             consensus_updated = 0
-            
+
+            # Accumulate all report writes into Firestore write batches so the
+            # whole validator report costs one RPC round-trip per 500 ops
+            # instead of two sequential writes per miner
+            batch = self.db.batch()
+            batch_ops = 0
+            affected_miners = []
+            # Dedupe keys staged in the current batch; only marked seen once
+            # the batch commit succeeds, so a failed commit leaves retries
+            # free to re-stage the same reports
+            pending_seen = []
+
+            # The dedupe map only needs to cover the current epoch
+            if epoch != self._seen_reports_epoch:
+                self._seen_reports = {}
+                self._seen_reports_epoch = epoch
+
+            # One clock read for the whole batch
+            now = datetime.now()
+            now_utc = datetime.now(timezone.utc)
+
             for miner_status in miner_statuses:
                 try:
                     miner_uid = miner_status.get('uid')
                     if miner_uid is None:
-                        print(f"      ⚠️ Skipping miner without UID: {miner_status}")
+                        logger.debug("⚠️ Skipping miner without UID: %s", miner_status)
                         continue
-                    
+
                     # Store individual validator report
                     report = ValidatorReport(
                         validator_uid=validator_uid,
                         miner_uid=miner_uid,
-                        timestamp=datetime.now(),
+                        timestamp=now_utc,
                         epoch=epoch,
                         miner_status=miner_status,
-                        confidence_score=self._calculate_validator_confidence(validator_uid, miner_status)
+                        confidence_score=self._calculate_validator_confidence(validator_uid, miner_status, now)
                     )
-                    
-                    # Store report in database
-                    await self._store_validator_report(report)
-                    
-                    # Update consensus status
-                    consensus_updated += await self._update_miner_consensus(miner_uid)
-                    
+
+                    # Skip the write only when the incoming content matches
+                    # the *latest* committed write for this doc - comparing
+                    # against the current hash (not every hash ever seen)
+                    # lets a status that reverts to earlier content within
+                    # the epoch still upsert and mark the miner dirty below
+                    doc_id = self._report_doc_id(report)
+                    if self._seen_reports.get(doc_id) == report.content_hash:
+                        logger.debug("Duplicate report for miner %s from validator %s, epoch %s - skipped",
+                                     miner_uid, validator_uid, epoch)
+                        processed_count += 1
+                        continue
+
+                    # Stage report writes in the batch (2 ops per miner)
+                    self._stage_validator_report(batch, report, doc_id)
+                    pending_seen.append((doc_id, report.content_hash))
+                    batch_ops += 2
+
+                    # Firestore batches are capped at 500 ops - flush and restart
+                    if batch_ops >= self.max_batch_ops:
+                        await self._fs(batch.commit)
+                        self._seen_reports.update(pending_seen)
+                        pending_seen = []
+                        batch = self.db.batch()
+                        batch_ops = 0
+
+                    affected_miners.append(miner_uid)
                     processed_count += 1
-                    print(f"      ✅ Processed miner {miner_uid}: {miner_status.get('hotkey', 'unknown')}")
-                    
+                    logger.debug("✅ Staged miner %s: %s", miner_uid, miner_status.get('hotkey', 'unknown'))
+
                 except Exception as e:
-                    print(f"      ❌ Error processing miner {miner_status.get('uid', 'unknown')}: {e}")
+                    logger.error("❌ Error processing miner %s: %s", miner_status.get('uid', 'unknown'), e)
                     continue
-            
-            # Update cache
-            await self._update_consensus_cache()
-            
-            print(f"   Successfully processed {processed_count}/{len(miner_statuses)} miners")
-            print(f"   Consensus updated for {consensus_updated} miners")
+
+            # Flush remaining staged writes in one round-trip
+            if batch_ops > 0:
+                await self._fs(batch.commit)
+                self._seen_reports.update(pending_seen)
+
+            # Mark affected miners dirty - the background worker debounces and
+            # recomputes consensus once per miner per burst instead of once
+            # per incoming report
+            dirty_miners = set(affected_miners)
+            if dirty_miners:
+                self._dirty_miners |= dirty_miners
+                self._dirty_event.set()
+                self._ensure_consensus_worker()
+                consensus_updated = len(dirty_miners)
+            
+            logger.info("Processed %d/%d miners, consensus scheduled for %d",
+                        processed_count, len(miner_statuses), consensus_updated)
             
             return {
                 "success": True,
@@ -138,99 +357,207 @@ class MultiValidatorManager:
             }
             
         except Exception as e:
-            print(f"❌ Error processing validator report: {e}")
+            logger.error("❌ Error processing validator report: %s", e)
             return {
                 "success": False,
                 "error": str(e),
                 "validator_uid": validator_uid
             }
     
-    async def _store_validator_report(self, report: ValidatorReport):
-        """Store individual validator report in database"""
+    def _ensure_consensus_worker(self):
+        """Start the background consensus worker if it is not already running"""
+        if self._consensus_worker_task is None or self._consensus_worker_task.done():
+            self._consensus_worker_task = asyncio.create_task(self._consensus_worker())
+
+    async def _consensus_worker(self):
+        """
+        Background worker that debounces consensus recomputation.
+
+        Waits for miners to be marked dirty, sleeps through a short debounce
+        window so a burst of reports coalesces, then recomputes consensus once
+        per unique dirty miner in parallel.
+        """
+        while True:
+            await self._dirty_event.wait()
+
+            # Debounce window - let a burst of incoming reports accumulate
+            await asyncio.sleep(self.consensus_debounce_seconds)
+
+            self._dirty_event.clear()
+            dirty_miners = self._dirty_miners
+            self._dirty_miners = set()
+
+            if not dirty_miners:
+                continue
+
+            # Fetch recent reports for the whole dirty set with chunked
+            # server-side range queries, then recompute per miner
+            reports_by_miner = await self._get_recent_reports_by_miner(dirty_miners)
+            results = await asyncio.gather(
+                *(self._update_miner_consensus(uid, reports_by_miner.get(uid, []))
+                  for uid in dirty_miners),
+                return_exceptions=True
+            )
+            updated = sum(r for r in results if isinstance(r, int))
+            logger.info("🔄 Consensus recomputed for %d/%d dirty miners", updated, len(dirty_miners))
+
+    async def _fs(self, fn, *args, **kwargs):
+        """Run a blocking Firestore SDK call in a worker thread
+
+        The Firestore client is synchronous; calling it inline from a
+        coroutine blocks the event loop and serializes every await point.
+        """
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    def _report_doc_id(self, report: ValidatorReport) -> str:
+        """Deterministic document ID for a (validator, miner, epoch) report
+
+        Repeated or retried reports for the same key overwrite idempotently
+        instead of accumulating one document per second-resolution timestamp.
+        """
+        key = f"{report.validator_uid}:{report.miner_uid}:{report.epoch}"
+        return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+    def _stage_validator_report(self, batch, report: ValidatorReport, doc_id: Optional[str] = None):
+        """Stage a validator report's writes into a Firestore batch"""
         try:
-            # Create unique document ID for this report
-            doc_id = f"{report.validator_uid}_{report.miner_uid}_{report.timestamp.strftime('%Y%m%d_%H%M%S')}"
-            
-            # Store in validator_reports collection
+            if doc_id is None:
+                doc_id = self._report_doc_id(report)
+
+            # Store in validator_reports collection - let Firestore stamp the
+            # write server-side so cutoff queries are immune to clock drift
+            report_dict = report.to_dict()
+            report_dict['timestamp'] = firestore.SERVER_TIMESTAMP
             report_ref = self.validator_reports_collection.document(doc_id)
-            report_ref.set(report.to_dict())
-            
+            batch.set(report_ref, report_dict)
+
             # Also update miner_status collection with latest report
             miner_ref = self.miner_status_collection.document(str(report.miner_uid))
-            miner_ref.set({
-                'last_updated': report.timestamp,
+            batch.set(miner_ref, {
+                'last_updated': firestore.SERVER_TIMESTAMP,
                 'last_reported_by_validator': report.validator_uid,
                 'epoch': report.epoch,
                 'validator_reports_count': firestore.Increment(1)
             }, merge=True)
-            
+
         except Exception as e:
-            print(f"❌ Error storing validator report: {e}")
+            logger.error("❌ Error staging validator report: %s", e)
             raise
     
-    async def _update_miner_consensus(self, miner_uid: int) -> int:
+    async def _update_miner_consensus(self, miner_uid: int, recent_reports: Optional[List[ValidatorReport]] = None) -> int:
         """
         Update consensus status for a specific miner
-        
+
+        Args:
+            miner_uid: ID of the miner
+            recent_reports: Prefetched recent reports (fetched if not given)
+
         Returns:
             Number of consensus updates made
         """
         try:
             # Get all recent reports for this miner
-            recent_reports = await self._get_recent_miner_reports(miner_uid)
+            if recent_reports is None:
+                recent_reports = await self._get_recent_miner_reports(miner_uid)
             
             if len(recent_reports) < self.min_consensus_validators:
-                print(f"      ⏳ Insufficient reports for consensus on miner {miner_uid}: {len(recent_reports)} < {self.min_consensus_validators}")
+                logger.debug("⏳ Insufficient reports for consensus on miner %s: %d < %d",
+                             miner_uid, len(recent_reports), self.min_consensus_validators)
                 return 0
             
+            # Skip the recompute and consensus write entirely when the same
+            # set of report contents already produced the stored consensus
+            # (idle validators re-sending identical statuses every epoch)
+            combined = ''.join(sorted(r.content_hash or '' for r in recent_reports))
+            input_hash = hashlib.blake2b(combined.encode(), digest_size=16).hexdigest()
+            if self._consensus_input_hash.get(miner_uid) == input_hash:
+                logger.debug("⏭️ Consensus input unchanged for miner %s - skipping recompute", miner_uid)
+                return 0
+
             # Calculate consensus status
             consensus_status = await self._calculate_consensus_status(miner_uid, recent_reports)
             
             # Store consensus status
             consensus_ref = self.consensus_collection.document(str(miner_uid))
-            consensus_ref.set({
+            await self._fs(consensus_ref.set, {
                 'miner_uid': miner_uid,
                 'consensus_status': consensus_status,
-                'last_consensus': datetime.now(),
+                'last_consensus': firestore.SERVER_TIMESTAMP,
                 'validator_reports_count': len(recent_reports),
                 'consensus_confidence': consensus_status.get('confidence', 0.0)
             }, merge=True)
             
             # Update cache
             self.consensus_cache[miner_uid] = consensus_status
+            self._consensus_input_hash[miner_uid] = input_hash
             
             return 1
             
         except Exception as e:
-            print(f"❌ Error updating miner consensus {miner_uid}: {e}")
+            logger.error("❌ Error updating miner consensus %s: %s", miner_uid, e)
             return 0
     
+    def _report_from_doc(self, doc) -> ValidatorReport:
+        """Build a ValidatorReport from a Firestore document
+
+        Firestore returns timestamps as timezone-aware datetimes, which
+        compare directly against UTC cutoffs - no per-document conversion.
+        """
+        return ValidatorReport(**doc.to_dict())
+
     async def _get_recent_miner_reports(self, miner_uid: int) -> List[ValidatorReport]:
         """Get recent validator reports for a specific miner"""
         try:
-            # Query recent reports (within consensus timeout)
-            cutoff_time = datetime.now() - self.consensus_timeout
-            
-            query = self.validator_reports_collection.where('miner_uid', '==', miner_uid)
-            docs = query.stream()
-            
-            recent_reports = []
-            for doc in docs:
-                report_data = doc.to_dict()
-                report_timestamp = report_data['timestamp']
-                
-                # Convert Firestore timestamp to datetime if needed
-                if hasattr(report_timestamp, 'timestamp'):
-                    report_timestamp = datetime.fromtimestamp(report_timestamp.timestamp())
-                
-                if report_timestamp >= cutoff_time:
-                    recent_reports.append(ValidatorReport(**report_data))
-            
-            return recent_reports
-            
+            # Query recent reports (within consensus timeout) - both filters
+            # run server-side against the (miner_uid, timestamp) index so old
+            # reports are never downloaded
+            cutoff_time = datetime.now(timezone.utc) - self.consensus_timeout
+
+            query = (self.validator_reports_collection
+                     .where('miner_uid', '==', miner_uid)
+                     .where('timestamp', '>=', cutoff_time))
+            docs = await self._fs(list, query.stream())
+
+            return [self._report_from_doc(doc) for doc in docs]
+
         except Exception as e:
-            print(f"❌ Error getting recent miner reports: {e}")
+            logger.error("❌ Error getting recent miner reports: %s", e)
             return []
+
+    async def _get_recent_reports_by_miner(self, miner_uids) -> Dict[int, List[ValidatorReport]]:
+        """
+        Get recent validator reports for a set of miners at once.
+
+        Fans out one `in`-query per chunk of 10 miner UIDs (the Firestore
+        `in`-filter limit) with a server-side timestamp cutoff, then dispatches
+        the parsed reports to per-miner lists client-side.
+        """
+        try:
+            cutoff_time = datetime.now(timezone.utc) - self.consensus_timeout
+            uids = list(miner_uids)
+            chunks = [uids[i:i + 10] for i in range(0, len(uids), 10)]
+
+            queries = [
+                (self.validator_reports_collection
+                 .where('miner_uid', 'in', chunk)
+                 .where('timestamp', '>=', cutoff_time))
+                for chunk in chunks
+            ]
+            doc_lists = await asyncio.gather(
+                *(self._fs(list, query.stream()) for query in queries)
+            )
+
+            reports_by_miner = {uid: [] for uid in uids}
+            for docs in doc_lists:
+                for doc in docs:
+                    report = self._report_from_doc(doc)
+                    reports_by_miner.setdefault(report.miner_uid, []).append(report)
+
+            return reports_by_miner
+
+        except Exception as e:
+            logger.error("❌ Error getting recent reports by miner: %s", e)
+            return {}
     
     async def _calculate_consensus_status(self, miner_uid: int, reports: List[ValidatorReport]) -> Dict[str, Any]:
         """
@@ -257,44 +584,69 @@ class MultiValidatorManager:
             # Calculate consensus for each field
             consensus_status = {}
             conflicts = []
-            
-            # Get all possible fields from reports
-            all_fields = set()
-            for report in reports:
-                all_fields.update(report.miner_status.keys())
-            
-            for field in all_fields:
-                field_values = []
-                field_weights = []
-                
-                for report in reports:
-                    if field in report.miner_status:
-                        field_values.append(report.miner_status[field])
-                        field_weights.append(report.confidence_score)
-                
-                if not field_values:
+
+            # SoA layout: one confidence/weights vector shared by all fields,
+            # and a contiguous value column per field, instead of rebuilding
+            # Python value/weight lists report-by-report for every field
+            report_count = len(reports)
+            weights = np.fromiter(
+                (r.confidence_score for r in reports), dtype=np.float64, count=report_count
+            )
+
+            # Materialize the status dicts into a flat columnar table once -
+            # each field's values become one contiguous list, so no field ever
+            # re-hashes its way through every report dict again
+            rows = [r.miner_status for r in reports]
+            all_fields = set().union(*rows)
+            cols = {f: [row.get(f, _MISSING) for row in rows] for f in all_fields}
+
+            # Dense SoA block for the known numeric fields: one
+            # (reports x fields) float64 matrix with NaN marking missing
+            # entries, reduced for all fields in a single kernel pass
+            numeric_values = np.full((report_count, len(NUMERIC_CONSENSUS_FIELDS)), np.nan)
+            for col_idx, numeric_field in enumerate(NUMERIC_CONSENSUS_FIELDS):
+                column = cols.get(numeric_field)
+                if column is None:
                     continue
-                
+                for row_idx, value in enumerate(column):
+                    if value is not _MISSING and value is not None:
+                        numeric_values[row_idx, col_idx] = value
+
+            numeric_consensus = _nan_weighted_columns_kernel(numeric_values, weights)
+            for col_idx, numeric_field in enumerate(NUMERIC_CONSENSUS_FIELDS):
+                if not np.isnan(numeric_consensus[col_idx]):
+                    consensus_status[numeric_field] = float(numeric_consensus[col_idx])
+
+            for field_name in all_fields:
+                if field_name in NUMERIC_CONSENSUS_FIELDS:
+                    continue
+
+                column = cols[field_name]
+                present = np.fromiter(
+                    (value is not _MISSING for value in column),
+                    dtype=bool, count=report_count
+                )
+                if not present.any():
+                    continue
+
+                field_weights = weights[present]
+                field_values = [value for value in column if value is not _MISSING]
+
                 # Handle different field types
-                if field in ['stake', 'performance_score', 'current_load']:
-                    # Numeric fields - use weighted average
-                    consensus_value = self._weighted_average(field_values, field_weights)
-                    consensus_status[field] = consensus_value
-                    
-                elif field in ['is_serving', 'hotkey']:
+                if field_name in ('is_serving', 'hotkey'):
                     # Boolean/String fields - use majority vote
                     consensus_value, conflict = self._majority_vote(field_values, field_weights)
-                    consensus_status[field] = consensus_value
+                    consensus_status[field_name] = consensus_value
                     if conflict:
-                        conflicts.append((field, conflict))
-                        
+                        conflicts.append((field_name, conflict))
+
                 else:
                     # Other fields - use most recent high-confidence report
                     consensus_value = self._most_recent_high_confidence(field_values, field_weights, reports)
-                    consensus_status[field] = consensus_value
+                    consensus_status[field_name] = consensus_value
             
             # Add consensus metadata
-            consensus_status['consensus_timestamp'] = datetime.now()
+            consensus_status['consensus_timestamp'] = datetime.now(timezone.utc)
             consensus_status['consensus_validators'] = list(validator_reports.keys())
             consensus_status['consensus_confidence'] = self._calculate_overall_confidence(reports)
             consensus_status['conflicts_detected'] = conflicts
@@ -302,44 +654,37 @@ class MultiValidatorManager:
             return consensus_status
             
         except Exception as e:
-            print(f"❌ Error calculating consensus status: {e}")
+            logger.error("❌ Error calculating consensus status: %s", e)
             return {}
     
     def _weighted_average(self, values: List[float], weights: List[float]) -> float:
         """Calculate weighted average of numeric values"""
         if not values or not weights:
             return 0.0
-        
-        # Normalize weights
-        total_weight = sum(weights)
-        if total_weight == 0:
-            return sum(values) / len(values)
-        
-        weighted_sum = sum(v * w for v, w in zip(values, weights))
-        return weighted_sum / total_weight
-    
+
+        value_array = np.asarray(values, dtype=np.float64)
+        weight_array = np.asarray(weights, dtype=np.float64)
+        return float(_weighted_average_kernel(value_array, weight_array))
+
     def _majority_vote(self, values: List[Any], weights: List[float]) -> Tuple[Any, bool]:
         """Calculate majority vote with conflict detection"""
         if not values:
             return None, False
-        
-        # Count occurrences
-        value_counts = {}
-        for value, weight in zip(values, weights):
-            if value not in value_counts:
-                value_counts[value] = 0
-            value_counts[value] += weight
-        
-        # Find majority
-        total_weight = sum(weights)
-        majority_threshold = total_weight * 0.6  # 60% threshold
-        
-        for value, count in value_counts.items():
-            if count >= majority_threshold:
-                return value, False
-        
-        # No clear majority - conflict detected
-        return values[0], True  # Return first value as fallback
+
+        # Encode arbitrary (bool/string) values as small integer codes so the
+        # vote itself runs on contiguous arrays
+        code_by_value = {}
+        decoded_values = []
+        codes = np.empty(len(values), dtype=np.int64)
+        for i, value in enumerate(values):
+            if value not in code_by_value:
+                code_by_value[value] = len(decoded_values)
+                decoded_values.append(value)
+            codes[i] = code_by_value[value]
+
+        weight_array = np.asarray(weights, dtype=np.float64)
+        winning_code, conflict = _majority_vote_kernel(codes, weight_array, 0.6)  # 60% threshold
+        return decoded_values[winning_code], bool(conflict)
     
     def _most_recent_high_confidence(self, values: List[Any], weights: List[float], reports: List[ValidatorReport]) -> Any:
         """Get most recent value from high-confidence reports"""
@@ -362,66 +707,64 @@ class MultiValidatorManager:
         """Calculate overall confidence score for consensus"""
         if not reports:
             return 0.0
-        
-        # Average confidence of all reports
-        avg_confidence = sum(r.confidence_score for r in reports) / len(reports)
-        
-        # Bonus for having multiple validators
-        validator_bonus = min(0.2, len(set(r.validator_uid for r in reports)) * 0.1)
-        
-        # Penalty for conflicts
-        conflict_penalty = 0.0
+
+        confidence_scores = np.fromiter(
+            (r.confidence_score for r in reports), dtype=np.float64, count=len(reports)
+        )
+        unique_validators = len(set(r.validator_uid for r in reports))
+
         # TODO: Implement conflict detection penalty
-        
-        return min(1.0, avg_confidence + validator_bonus - conflict_penalty)
+        return float(_overall_confidence_kernel(confidence_scores, unique_validators))
     
-    def _calculate_validator_confidence(self, validator_uid: int, miner_status: Dict[str, Any]) -> float:
-        """Calculate confidence score for a validator's report"""
+    @staticmethod
+    def _calculate_validator_confidence(validator_uid: int, miner_status: Dict[str, Any], now: Optional[datetime] = None) -> float:
+        """Calculate confidence score for a validator's report
+
+        Runs once per miner per report, so it uses precomputed frozenset
+        intersections and a caller-supplied clock instead of per-field
+        membership loops and a datetime.now() per call.
+        """
         try:
-            # Base confidence
+            if now is None:
+                now = datetime.now()
+
+            keys = miner_status.keys()
+
+            # Base confidence, penalty for incomplete data, bonus for
+            # detailed data
             confidence = 1.0
-            
-            # Penalty for incomplete data
-            required_fields = ['uid', 'hotkey', 'stake', 'is_serving']
-            missing_fields = [f for f in required_fields if f not in miner_status]
-            if missing_fields:
-                confidence -= len(missing_fields) * 0.1
-            
-            # Bonus for detailed data
-            detailed_fields = ['performance_score', 'current_load', 'task_type_specialization']
-            detailed_count = sum(1 for f in detailed_fields if f in miner_status)
-            confidence += detailed_count * 0.05
-            
+            confidence -= len(REQUIRED_STATUS_FIELDS - keys) * 0.1
+            confidence += len(DETAILED_STATUS_FIELDS & keys) * 0.05
+
             # Bonus for recent data
-            if 'last_seen' in miner_status:
+            last_seen = miner_status.get('last_seen')
+            if last_seen is not None:
                 try:
-                    last_seen = datetime.fromisoformat(miner_status['last_seen'])
-                    time_diff = datetime.now() - last_seen
+                    time_diff = now - datetime.fromisoformat(last_seen)
                     if time_diff < timedelta(minutes=5):
                         confidence += 0.1
                     elif time_diff < timedelta(minutes=15):
                         confidence += 0.05
-                except:
+                except (TypeError, ValueError):
                     pass
-            
+
             return max(0.1, min(1.0, confidence))
-            
+
         except Exception as e:
-            print(f"❌ Error calculating validator confidence: {e}")
+            logger.error("❌ Error calculating validator confidence: %s", e)
             return 0.5
     
     async def get_consensus_miner_status(self, miner_uid: int) -> Optional[Dict[str, Any]]:
         """Get consensus status for a specific miner"""
         try:
-            # Check cache first
-            if miner_uid in self.consensus_cache:
-                cache_age = datetime.now() - self.last_cache_update
-                if cache_age < self.cache_ttl:
-                    return self.consensus_cache[miner_uid]
+            # Check cache first - TTLCache evicts expired entries on lookup
+            cached = self.consensus_cache.get(miner_uid)
+            if cached is not None:
+                return cached
             
             # Query database
             consensus_ref = self.consensus_collection.document(str(miner_uid))
-            consensus_doc = consensus_ref.get()
+            consensus_doc = await self._fs(consensus_ref.get)
             
             if consensus_doc.exists:
                 consensus_data = consensus_doc.to_dict()
@@ -434,14 +777,14 @@ class MultiValidatorManager:
             return None
             
         except Exception as e:
-            print(f"❌ Error getting consensus miner status: {e}")
+            logger.error("❌ Error getting consensus miner status: %s", e)
             return None
     
     async def get_all_consensus_miners(self) -> List[Dict[str, Any]]:
         """Get consensus status for all miners"""
         try:
             # Query all consensus documents
-            docs = self.consensus_collection.stream()
+            docs = await self._fs(list, self.consensus_collection.stream())
             
             miners = []
             for doc in docs:
@@ -459,40 +802,41 @@ class MultiValidatorManager:
             return miners
             
         except Exception as e:
-            print(f"❌ Error getting all consensus miners: {e}")
+            logger.error("❌ Error getting all consensus miners: %s", e)
             return []
     
-    async def _update_consensus_cache(self):
-        """Update in-memory consensus cache"""
-        try:
-            self.last_cache_update = datetime.now()
-            # Cache is updated incrementally in _update_miner_consensus
-            
-        except Exception as e:
-            print(f"❌ Error updating consensus cache: {e}")
-    
+    async def _collection_count(self, query) -> int:
+        """Run a server-side count aggregation over a collection or query"""
+        result = await self._fs(lambda: query.count().get())
+        return int(result[0][0].value)
+
     async def get_validator_report_stats(self) -> Dict[str, Any]:
         """Get statistics about validator reports and consensus"""
         try:
-            # Count total reports
-            total_reports = len(list(self.validator_reports_collection.stream()))
-            
-            # Count consensus miners
-            consensus_miners = len(list(self.consensus_collection.stream()))
-            
-            # Count active validators
+            # Count via server-side aggregation queries - a single integer
+            # comes back instead of every document in the collection
+            total_reports = await self._collection_count(self.validator_reports_collection)
+            consensus_miners = await self._collection_count(self.consensus_collection)
+
+            # Count active validators over the last hour, projecting only the
+            # validator_uid field instead of full report documents
             active_validators = set()
-            recent_reports = self.validator_reports_collection.where('timestamp', '>=', datetime.now() - timedelta(hours=1))
-            for doc in recent_reports.stream():
+            recent_reports = (self.validator_reports_collection
+                              .where('timestamp', '>=', datetime.now(timezone.utc) - timedelta(hours=1))
+                              .select(['validator_uid']))
+            for doc in await self._fs(list, recent_reports.stream()):
                 active_validators.add(doc.to_dict().get('validator_uid'))
-            
-            # Calculate consensus confidence distribution
+
+            # Calculate consensus confidence distribution from a projection of
+            # just the confidence field
             confidence_scores = []
-            for doc in self.consensus_collection.stream():
-                confidence = doc.to_dict().get('consensus_confidence', 0.0)
-                confidence_scores.append(confidence)
-            
-            avg_confidence = statistics.mean(confidence_scores) if confidence_scores else 0.0
+            confidence_query = self.consensus_collection.select(['consensus_confidence'])
+            for doc in await self._fs(list, confidence_query.stream()):
+                confidence_scores.append(doc.to_dict().get('consensus_confidence', 0.0))
+
+            # Plain sum/len - statistics.mean pays per-element numeric
+            # dispatch that adds nothing for a list of floats
+            avg_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0.0
             
             return {
                 'total_validator_reports': total_reports,
@@ -504,5 +848,5 @@ class MultiValidatorManager:
             }
             
         except Exception as e:
-            print(f"❌ Error getting validator report stats: {e}")
+            logger.error("❌ Error getting validator report stats: %s", e)
             return {}
@@ -6,7 +6,7 @@
 import time
 import torch
 from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 
 class SummarizationPipeline:
@@ -25,10 +25,30 @@ class SummarizationPipeline:
         self.model_name = model_name
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         
-        # Load model and tokenizer
-        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-        self.model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
-        self.model.to(self.device)
+        # Load model and tokenizer (fast Rust tokenizer, cached for the
+        # lifetime of the pipeline)
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
+
+        if self.device == "cuda":
+            # bf16 halves weight bytes, and decode steps are memory-bandwidth
+            # bound on GPU
+            self.model = AutoModelForSeq2SeqLM.from_pretrained(
+                model_name, torch_dtype=torch.bfloat16, low_cpu_mem_usage=True
+            )
+            self.model.to(self.device)
+        else:
+            self.model = AutoModelForSeq2SeqLM.from_pretrained(
+                model_name, low_cpu_mem_usage=True
+            )
+            self.model.to(self.device)
+            try:
+                # Dynamic int8 quantization of the Linear layers quarters
+                # weight traffic on CPU
+                self.model = torch.ao.quantization.quantize_dynamic(
+                    self.model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+            except Exception as e:
+                print(f"⚠️ Dynamic quantization unavailable, using FP32: {e}")
         
         # Language code mapping
         self.language_codes = {
@@ -57,35 +77,70 @@ class SummarizationPipeline:
         Returns:
             Tuple of (summary_text, processing_time)
         """
+        summaries, processing_time = self.summarize_batch(
+            [text], max_length=max_length, min_length=min_length, language=language
+        )
+        return summaries[0], processing_time
+
+    def summarize_batch(self, texts: List[str], max_length: int = 130, min_length: int = 30, language: str = "en") -> Tuple[List[str], float]:
+        """
+        Summarize a batch of texts in a single padded generate call.
+
+        Running one beam search across the whole batch amortizes the kernel
+        launch overhead that dominates batch-size-1 generation.
+
+        Args:
+            texts: Input texts to summarize
+            max_length: Maximum length of each summary
+            min_length: Minimum length of each summary
+            language: Language code (e.g., 'en', 'es', 'fr')
+
+        Returns:
+            Tuple of (list of summaries, processing_time)
+        """
         start_time = time.time()
-        
+
         try:
-            # Tokenize input text
+            # Tokenize the whole batch with padding
             inputs = self.tokenizer(
-                text, 
-                return_tensors="pt", 
-                max_length=1024, 
+                texts,
+                return_tensors="pt",
+                max_length=1024,
                 truncation=True,
                 padding=True
-            ).to(self.device)
-            
-            # Generate summary
-            summary_ids = self.model.generate(
-                inputs["input_ids"],
-                max_length=max_length,
-                min_length=min_length,
-                length_penalty=2.0,
-                num_beams=4,
-                early_stopping=True
             )
-            
-            # Decode summary
-            summary = self.tokenizer.decode(summary_ids[0], skip_special_tokens=True)
-            
+            if self.device == "cuda":
+                # Pinned staging buffers let the host-to-device copy run as
+                # DMA overlapped with kernel execution
+                inputs = {
+                    k: v.pin_memory().to(self.device, non_blocking=True)
+                    for k, v in inputs.items()
+                }
+            else:
+                inputs = inputs.to(self.device)
+
+            # Generate summaries for the whole batch at once.
+            # inference_mode skips autograd tracking entirely and use_cache
+            # keeps the decoder KV cache on for every decode step
+            with torch.inference_mode():
+                summary_ids = self.model.generate(
+                    inputs["input_ids"],
+                    attention_mask=inputs["attention_mask"],
+                    max_length=max_length,
+                    min_length=min_length,
+                    length_penalty=2.0,
+                    num_beams=4,
+                    early_stopping=True,
+                    use_cache=True
+                )
+
+            # Decode summaries
+            summaries = self.tokenizer.batch_decode(summary_ids, skip_special_tokens=True)
+
             processing_time = time.time() - start_time
-            
-            return summary.strip(), processing_time
-            
+
+            return [summary.strip() for summary in summaries], processing_time
+
         except Exception as e:
             processing_time = time.time() - start_time
             raise Exception(f"Summarization failed: {str(e)}")
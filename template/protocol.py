@@ -43,7 +43,10 @@ class AudioTask(bt.Synapse):
 
     # Required request inputs
     task_type: str = "transcription"  # Changed from TaskType enum to str
-    input_data: str  # Base64 encoded data
+    # Base64 encoded data. Kept as str rather than raw bytes: the axon wire
+    # format is JSON, so binary payloads have to be text-encoded anyway and a
+    # bytes field would break every deployed miner.
+    input_data: str
     language: str = "en"
     
     # Optional request outputs
@@ -66,18 +69,23 @@ class AudioTask(bt.Synapse):
             "error_message": self.error_message
         }
 
-    def encode_audio(self, audio_bytes: bytes) -> str:
+    @staticmethod
+    def encode_audio(audio_bytes: bytes) -> str:
         """Encode audio bytes to base64 string."""
-        return base64.b64encode(audio_bytes).decode('utf-8')
-    
-    def decode_audio(self, audio_b64: str) -> bytes:
+        return base64.b64encode(audio_bytes).decode('ascii')
+
+    @staticmethod
+    def decode_audio(audio_b64: str) -> bytes:
         """Decode base64 string to audio bytes."""
-        return base64.b64decode(audio_b64.encode('utf-8'))
-    
-    def encode_text(self, text: str) -> str:
+        # b64decode takes the str directly - no intermediate encode pass
+        return base64.b64decode(audio_b64)
+
+    @staticmethod
+    def encode_text(text: str) -> str:
         """Encode text to base64 string."""
-        return base64.b64encode(text.encode('utf-8')).decode('utf-8')
-    
-    def decode_text(self, text_b64: str) -> str:
+        return base64.b64encode(text.encode('utf-8')).decode('ascii')
+
+    @staticmethod
+    def decode_text(text_b64: str) -> str:
         """Decode base64 string to text."""
-        return base64.b64decode(text_b64.encode('utf-8')).decode('utf-8')
+        return base64.b64decode(text_b64).decode('utf-8')
@@ -19,11 +19,94 @@
 import numpy as np
 from typing import List, Dict, Any
 import bittensor as bt
-from difflib import SequenceMatcher
 import time
 
 from template.protocol import AudioTask
 
+# Use a Numba-compiled edit-distance kernel if available
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator when numba is not installed"""
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+    prange = range
+    NUMBA_AVAILABLE = False
+
+
+@njit(cache=True)
+def _levenshtein_kernel(ref_ids, hyp_ids):
+    """Token-level Levenshtein distance over int32 id arrays.
+
+    Two-row DP - the min-of-three row update runs in native code instead of
+    per-cell Python dispatch, which matters when validators score batches of
+    long transcripts.
+    """
+    n_ref = ref_ids.shape[0]
+    n_hyp = hyp_ids.shape[0]
+    prev = np.arange(n_hyp + 1, dtype=np.int32)
+    curr = np.empty(n_hyp + 1, dtype=np.int32)
+
+    for i in range(1, n_ref + 1):
+        curr[0] = i
+        for j in range(1, n_hyp + 1):
+            cost = 0 if ref_ids[i - 1] == hyp_ids[j - 1] else 1
+            best = prev[j - 1] + cost
+            if prev[j] + 1 < best:
+                best = prev[j] + 1
+            if curr[j - 1] + 1 < best:
+                best = curr[j - 1] + 1
+            curr[j] = best
+        prev, curr = curr, prev
+
+    return prev[n_hyp]
+
+
+@njit(parallel=True, cache=True)
+def _levenshtein_batch_kernel(ref_flat, ref_offsets, hyp_flat, hyp_offsets, out):
+    """Run the edit-distance DP for every (ref, hyp) pair in parallel.
+
+    The ragged token-id sequences arrive flattened with offset arrays
+    (offsets[k]:offsets[k + 1] bounds pair k), so prange can hand each pair
+    to a worker thread without boxing any Python objects.
+    """
+    for k in prange(out.shape[0]):
+        out[k] = _levenshtein_kernel(
+            ref_flat[ref_offsets[k]:ref_offsets[k + 1]],
+            hyp_flat[hyp_offsets[k]:hyp_offsets[k + 1]]
+        )
+
+
+def _tokens_to_ids(ref_tokens: list, hyp_tokens: list):
+    """Map both token sequences onto shared int32 ids for the DP kernel."""
+    vocab = {}
+
+    def to_ids(tokens):
+        ids = np.empty(len(tokens), dtype=np.int32)
+        for i, token in enumerate(tokens):
+            ids[i] = vocab.setdefault(token, len(vocab))
+        return ids
+
+    return to_ids(ref_tokens), to_ids(hyp_tokens)
+
+
+def _transcription_accuracy(response_text: str, expected_output: str) -> float:
+    """Transcription accuracy as 1 - word error rate, floored at 0."""
+    ref_tokens = expected_output.lower().split()
+    hyp_tokens = response_text.lower().split()
+
+    if not ref_tokens:
+        return 1.0 if not hyp_tokens else 0.0
+
+    ref_ids, hyp_ids = _tokens_to_ids(ref_tokens, hyp_tokens)
+    distance = int(_levenshtein_kernel(ref_ids, hyp_ids))
+    return max(0.0, 1.0 - distance / len(ref_tokens))
+
 
 def calculate_speed_score(processing_time: float, max_acceptable_time: float = 10.0) -> float:
     """
@@ -44,6 +127,25 @@ def calculate_speed_score(processing_time: float, max_acceptable_time: float = 1
     return min(1.0, max(0.0, speed_score))
 
 
+def calculate_speed_score_batch(processing_times, max_acceptable_time: float = 10.0) -> np.ndarray:
+    """
+    Calculate speed scores for a batch of processing times at once.
+
+    One vectorized np.exp over the whole array replaces a Python call per
+    response when scoring the results of a concurrent dispatch.
+
+    Args:
+        processing_times: Array of times taken to process each task
+        max_acceptable_time: Maximum acceptable time (default 10 seconds)
+
+    Returns:
+        Array of speed scores between 0 and 1
+    """
+    times = np.asarray(processing_times, dtype=np.float64)
+    scores = np.clip(np.exp(-times / max_acceptable_time), 0.0, 1.0)
+    return np.where(times > 0, scores, 0.0)
+
+
 def calculate_accuracy_score(response_text: str, expected_output: str, task_type: str) -> float:
     """
     Calculate accuracy score based on task type.
@@ -60,9 +162,9 @@ def calculate_accuracy_score(response_text: str, expected_output: str, task_type
         return 0.0
     
     if task_type == "transcription":
-        # Use sequence similarity for transcription
-        from difflib import SequenceMatcher
-        return SequenceMatcher(None, response_text.lower(), expected_output.lower()).ratio()
+        # Word error rate over tokenized transcripts, computed by the
+        # compiled edit-distance kernel
+        return _transcription_accuracy(response_text, expected_output)
     
     elif task_type == "summarization":
         # Use word overlap and length appropriateness for summarization
@@ -91,6 +193,66 @@ def calculate_accuracy_score(response_text: str, expected_output: str, task_type
         return 0.0
 
 
+def calculate_accuracy_score_batch(response_texts: List[str], expected_outputs: List[str], task_type: str) -> np.ndarray:
+    """
+    Calculate accuracy scores for a batch of responses at once.
+
+    For transcription the token sequences of every pair are flattened into
+    offset-indexed arrays and scored by one parallel edit-distance kernel
+    call; other task types fall back to the scalar scorer per pair.
+
+    Args:
+        response_texts: Miner response texts
+        expected_outputs: Expected output texts, one per response
+        task_type: Type of task performed
+
+    Returns:
+        Array of accuracy scores between 0 and 1
+    """
+    n = len(response_texts)
+    scores = np.zeros(n, dtype=np.float64)
+
+    if task_type != "transcription":
+        for i in range(n):
+            scores[i] = calculate_accuracy_score(response_texts[i], expected_outputs[i], task_type)
+        return scores
+
+    # Degenerate pairs (empty ref or hyp) are resolved here; the rest are
+    # flattened for the kernel
+    kernel_rows = []
+    ref_chunks, hyp_chunks = [], []
+    for i in range(n):
+        if not response_texts[i] or not expected_outputs[i]:
+            continue
+        ref_tokens = expected_outputs[i].lower().split()
+        hyp_tokens = response_texts[i].lower().split()
+        if not ref_tokens:
+            scores[i] = 1.0 if not hyp_tokens else 0.0
+            continue
+        ref_ids, hyp_ids = _tokens_to_ids(ref_tokens, hyp_tokens)
+        kernel_rows.append(i)
+        ref_chunks.append(ref_ids)
+        hyp_chunks.append(hyp_ids)
+
+    if not kernel_rows:
+        return scores
+
+    ref_offsets = np.zeros(len(ref_chunks) + 1, dtype=np.int64)
+    hyp_offsets = np.zeros(len(hyp_chunks) + 1, dtype=np.int64)
+    np.cumsum([c.shape[0] for c in ref_chunks], out=ref_offsets[1:])
+    np.cumsum([c.shape[0] for c in hyp_chunks], out=hyp_offsets[1:])
+
+    ref_flat = np.concatenate(ref_chunks)
+    hyp_flat = np.concatenate(hyp_chunks)
+    distances = np.empty(len(kernel_rows), dtype=np.int32)
+    _levenshtein_batch_kernel(ref_flat, ref_offsets, hyp_flat, hyp_offsets, distances)
+
+    ref_lens = np.diff(ref_offsets)
+    batch_scores = np.maximum(0.0, 1.0 - distances / ref_lens)
+    scores[kernel_rows] = batch_scores
+    return scores
+
+
 def calculate_stake_score(stake: float, max_stake: float) -> float:
     """
     Calculate stake-based score.
@@ -110,88 +272,63 @@ def calculate_stake_score(stake: float, max_stake: float) -> float:
     return stake_score
 
 
-def reward(
-    response: Dict[str, Any],
-    expected_output: str,
-    task_type: str,
-    processing_time: float,
-    stake: float,
-    max_stake: float,
-    max_acceptable_time: float = 10.0,
-    performance_history: Dict = None
-) -> float:
-    """
-    Calculate comprehensive reward for a miner response with performance history bonus.
-    
-    Args:
-        response: Miner's response dictionary
-        expected_output: Expected output for the task
-        task_type: Type of task performed
-        processing_time: Time taken to process
-        stake: Miner's stake
-        max_stake: Maximum stake in network
-        max_acceptable_time: Maximum acceptable processing time
-        performance_history: Miner's performance history data
-        
-    Returns:
-        Reward score between 0 and 1
-    """
-    # Check for errors
+def _extract_response_text(response: Dict[str, Any], task_type: str):
+    """Decode a miner response to scoreable text, or None if unusable."""
     if response.get("error_message"):
         bt.logging.warning(f"Miner returned error: {response['error_message']}")
-        return 0.0
-    
-    # Extract response data
+        return None
+
     output_data = response.get("output_data")
     if not output_data:
         bt.logging.warning("Miner returned no output data")
-        return 0.0
-    
-    # Decode response based on task type
+        return None
+
     if task_type in ["transcription", "summarization"]:
         try:
-            response_text = AudioTask.decode_text(output_data)
+            return AudioTask.decode_text(output_data)
         except Exception as e:
             bt.logging.warning(f"Failed to decode text response: {e}")
-            return 0.0
-    else:  # TTS
-        response_text = output_data  # Keep as base64 for audio
-    
-    # Calculate individual scores
-    speed_score = calculate_speed_score(processing_time, max_acceptable_time)
-    accuracy_score = calculate_accuracy_score(response_text, expected_output, task_type)
-    stake_score = calculate_stake_score(stake, max_stake)
-    
-    # Performance history bonus (if available)
+            return None
+
+    return output_data  # TTS: keep as base64 for audio
+
+
+def _performance_bonus(performance_history: Dict, task_type: str) -> float:
+    """Bonus from a miner's performance history (success rate, specialization)."""
     performance_bonus = 0.0
     if performance_history:
         # Success rate bonus (up to 15%)
         success_rate = performance_history.get('success_rate', 0.5)
         performance_bonus += success_rate * 0.15
-        
+
         # Task type specialization bonus (up to 10%)
         if task_type in performance_history.get('task_type_performance', {}):
             task_perf = performance_history['task_type_performance'][task_type]
             if task_perf.get('total', 0) >= 5:  # Minimum samples
                 specialization_bonus = task_perf.get('success_rate', 0.5) * 0.10
                 performance_bonus += specialization_bonus
-        
+
         # Recent performance bonus (up to 5%)
         recent_success_rate = performance_history.get('recent_success_rate', 0.5)
         performance_bonus += recent_success_rate * 0.05
-    
-    # Weighted combination of scores with performance bonus
-    # Speed: 35%, Accuracy: 35%, Stake: 20%, Performance History: 10%
+
+    return performance_bonus
+
+
+def _combine_scores(speed_score: float, accuracy_score: float, stake_score: float, performance_bonus: float) -> float:
+    """Weighted combination of the component scores, capped at 1.0.
+
+    Weights: Speed 35%, Accuracy 35%, Stake 20%, Performance History 10%.
+    """
     final_score = (
         speed_score * 0.35 +
         accuracy_score * 0.35 +
         stake_score * 0.20 +
         performance_bonus
     )
-    
-    # Cap the final score at 1.0
+
     final_score = min(1.0, final_score)
-    
+
     bt.logging.info(
         f"Reward breakdown - Speed: {speed_score:.3f}, "
         f"Accuracy: {accuracy_score:.3f}, "
@@ -199,10 +336,50 @@ def reward(
         f"Performance Bonus: {performance_bonus:.3f}, "
         f"Final: {final_score:.3f}"
     )
-    
+
     return final_score
 
 
+def reward(
+    response: Dict[str, Any],
+    expected_output: str,
+    task_type: str,
+    processing_time: float,
+    stake: float,
+    max_stake: float,
+    max_acceptable_time: float = 10.0,
+    performance_history: Dict = None
+) -> float:
+    """
+    Calculate comprehensive reward for a miner response with performance history bonus.
+    
+    Args:
+        response: Miner's response dictionary
+        expected_output: Expected output for the task
+        task_type: Type of task performed
+        processing_time: Time taken to process
+        stake: Miner's stake
+        max_stake: Maximum stake in network
+        max_acceptable_time: Maximum acceptable processing time
+        performance_history: Miner's performance history data
+        
+    Returns:
+        Reward score between 0 and 1
+    """
+    # Check for errors and decode the response based on task type
+    response_text = _extract_response_text(response, task_type)
+    if response_text is None:
+        return 0.0
+
+    # Calculate individual scores
+    speed_score = calculate_speed_score(processing_time, max_acceptable_time)
+    accuracy_score = calculate_accuracy_score(response_text, expected_output, task_type)
+    stake_score = calculate_stake_score(stake, max_stake)
+    performance_bonus = _performance_bonus(performance_history, task_type)
+
+    return _combine_scores(speed_score, accuracy_score, stake_score, performance_bonus)
+
+
 def get_rewards(
     self,
     task_type: str,
@@ -229,17 +406,31 @@ def get_rewards(
     Returns:
         Array of reward scores
     """
-    rewards = []
     max_stake = float(self.metagraph.S.max()) if len(self.metagraph.S) > 0 else 1.0
-    
-    for i, response in enumerate(responses):
-        if i >= len(miner_uids):
-            break
-            
+    n = min(len(responses), len(miner_uids))
+
+    # Rewards default to 0.0 for unusable responses and missing miners
+    rewards = np.zeros(len(miner_uids), dtype=np.float64)
+
+    # Decode every response once, then score speed and accuracy for the
+    # whole batch in two vectorized passes instead of per-response calls
+    response_texts = [_extract_response_text(responses[i], task_type) for i in range(n)]
+    processing_times = np.array(
+        [responses[i].get("processing_time", 0.0) for i in range(n)], dtype=np.float64
+    )
+    speed_scores = calculate_speed_score_batch(processing_times, max_acceptable_time)
+    accuracy_scores = calculate_accuracy_score_batch(
+        [text or "" for text in response_texts], [expected_output] * n, task_type
+    )
+
+    for i in range(n):
+        if response_texts[i] is None:
+            continue
+
         uid = miner_uids[i]
         stake = float(self.metagraph.S[uid])
-        processing_time = response.get("processing_time", 0.0)
-        
+        stake_score = calculate_stake_score(stake, max_stake)
+
         # Get performance history if available
         performance_history = None
         if miner_tracker and hasattr(miner_tracker, 'miners') and uid in miner_tracker.miners:
@@ -249,26 +440,13 @@ def get_rewards(
                 'recent_success_rate': miner.recent_success_rate,
                 'task_type_performance': miner.task_type_performance
             }
-        
-        # Calculate reward for this miner
-        miner_reward = reward(
-            response=response,
-            expected_output=expected_output,
-            task_type=task_type,
-            processing_time=processing_time,
-            stake=stake,
-            max_stake=max_stake,
-            max_acceptable_time=max_acceptable_time,
-            performance_history=performance_history
+        performance_bonus = _performance_bonus(performance_history, task_type)
+
+        rewards[i] = _combine_scores(
+            float(speed_scores[i]), float(accuracy_scores[i]), stake_score, performance_bonus
         )
-        
-        rewards.append(miner_reward)
-    
-    # Ensure we have rewards for all miners
-    while len(rewards) < len(miner_uids):
-        rewards.append(0.0)
-    
-    return np.array(rewards)
+
+    return rewards
 
 
 def run_validator_pipeline(task_type: str, input_data: str, language: str = "en") -> tuple:
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Shared test-audio helpers for the Bittensor communication tests.
+
+Both test_final_working.py and test_bittensor_client.py synthesize the same
+sine test tone; generating it here keeps the hot loop in one place and
+compiled.
+"""
+
+import functools
+import hashlib
+import math
+import struct
+from pathlib import Path
+
+import numpy as np
+
+# Use a Numba-compiled sine fill if available
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _fill_sine_int16(out, sample_rate, frequency):
+        """Fill a preallocated int16 buffer with the quantized test sinusoid.
+
+        A single fused loop - no linspace allocation, no ufunc temporaries,
+        no float32 intermediate buffer - that LLVM auto-vectorizes. The 0.3
+        amplitude is folded into the int16 scale. cache=True amortizes the
+        compile cost across test runs.
+        """
+        scale = 0.3 * 32767.0
+        for i in range(out.shape[0]):
+            out[i] = int(math.sin(2.0 * math.pi * frequency * i / sample_rate) * scale)
+else:
+    def _fill_sine_int16(out, sample_rate, frequency):
+        """NumPy fallback when numba is not installed."""
+        t = np.arange(out.shape[0], dtype=np.float64) / sample_rate
+        out[:] = (np.sin(2.0 * np.pi * frequency * t) * (0.3 * 32767.0)).astype(np.int16)
+
+
+def _encode_wav_pcm16(pcm, sample_rate):
+    """Encode int16 samples as a mono PCM16 WAV.
+
+    The container is a fixed 44-byte RIFF header plus the raw samples, so
+    there is no need to route a deterministic test tone through
+    soundfile/libsndfile: one struct.pack plus one tobytes() does it.
+    """
+    data_size = pcm.nbytes
+    header = struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b'data', data_size
+    )
+    return header + pcm.tobytes()
+
+
+# On-disk fixture directory: the tone is deterministic, so after the first
+# run every later pytest invocation (fresh process, cold lru_cache) only pays
+# a single read_bytes() instead of regenerating and re-encoding the waveform
+_FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+
+def _fixture_path(duration, sample_rate, frequency):
+    return _FIXTURE_DIR / (
+        f"sine_{frequency:g}hz_{duration:g}s_{sample_rate // 1000}k.wav"
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_test_audio(duration, sample_rate, frequency):
+    """Generate and encode the tone once per parameter set.
+
+    The returned bytes are immutable, so sharing one object across every
+    caller and test invocation is safe. A .wav copy is kept under
+    tests/fixtures/ so subsequent processes skip the synthesis entirely.
+    """
+    path = _fixture_path(duration, sample_rate, frequency)
+    try:
+        return path.read_bytes()
+    except OSError:
+        pass  # no fixture yet - synthesize it below
+
+    pcm = np.empty(int(sample_rate * duration), dtype=np.int16)
+    _fill_sine_int16(pcm, sample_rate, frequency)
+    wav = _encode_wav_pcm16(pcm, sample_rate)
+
+    try:
+        _FIXTURE_DIR.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(wav)
+    except OSError:
+        pass  # persisting the fixture is best-effort
+
+    return wav
+
+
+def create_test_audio(duration=2.0, sample_rate=16000, frequency=440.0):
+    """Create a simple test audio file."""
+    return _cached_test_audio(duration, sample_rate, frequency)
+
+
+# Digest -> encoded-string cache. Keyed on the 16-byte blake2b digest only,
+# so the raw payload bytes are never retained as part of a cache key.
+_ENCODE_CACHE = {}
+_ENCODE_CACHE_MAX = 64
+
+
+def encode_audio_cached(audio_bytes):
+    """Base64-encode an audio payload, memoized by content digest.
+
+    Identical payloads - the same cached test tone used across both test
+    scripts - are encoded once per process. The cache maps digest to
+    encoded string directly; the payload stays out of the key.
+    """
+    key = hashlib.blake2b(audio_bytes, digest_size=16).digest()
+    encoded = _ENCODE_CACHE.get(key)
+    if encoded is None:
+        from template.protocol import AudioTask
+        encoded = AudioTask.encode_audio(audio_bytes)
+        if len(_ENCODE_CACHE) >= _ENCODE_CACHE_MAX:
+            # Drop the oldest entry (dicts preserve insertion order)
+            _ENCODE_CACHE.pop(next(iter(_ENCODE_CACHE)))
+        _ENCODE_CACHE[key] = encoded
+    return encoded
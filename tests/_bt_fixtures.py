@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Shared Bittensor context for the communication tests.
+
+Wallet keyfile decryption, the subtensor websocket handshake, and the
+metagraph sync dominate these tests' wall time. Doing that setup once per
+process and handing every test the same synced objects lets each test after
+the first skip straight to the network call.
+"""
+
+import atexit
+import functools
+import os
+import pickle
+import time
+
+import aiohttp
+import bittensor as bt
+
+WALLET_NAME = "luno"
+WALLET_HOTKEY = "arusha"
+NETWORK = "finney"
+NETUID = 49
+
+# On-disk metagraph snapshot: repeated test runs within the TTL skip the
+# multi-MB chain sync entirely
+CACHE_DIR = os.path.expanduser("~/.cache/violetaudio")
+METAGRAPH_CACHE_TTL = 60  # seconds
+
+
+def _sync_or_load(metagraph, subtensor, netuid, ttl=METAGRAPH_CACHE_TTL):
+    """Return a synced metagraph, reusing a snapshot younger than ttl."""
+    cache_path = os.path.join(CACHE_DIR, f"metagraph_{netuid}.pkl")
+
+    try:
+        if time.time() - os.path.getmtime(cache_path) < ttl:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        pass  # no usable snapshot - fall through to a chain sync
+
+    metagraph.sync(subtensor=subtensor)
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump(metagraph, f)
+    except (OSError, pickle.PicklingError):
+        pass  # snapshotting is best-effort
+
+    return metagraph
+
+
+def _attach_persistent_session(dendrite):
+    """Give the dendrite a keep-alive aiohttp session with a shared pool.
+
+    Depending on the installed bittensor version the dendrite may rebuild
+    its ClientSession (and re-resolve DNS, re-handshake TCP+TLS) per call.
+    Pre-seeding _session with a connector that keeps connections and DNS
+    entries warm lets concurrent requests reuse sockets. Best-effort: if
+    this bittensor version does not expose the hook, the default session
+    management stands.
+    """
+    try:
+        connector = aiohttp.TCPConnector(
+            limit=64,
+            ttl_dns_cache=300,
+            keepalive_timeout=300,
+            enable_cleanup_closed=True,
+        )
+        dendrite._session = aiohttp.ClientSession(connector=connector)
+    except (AttributeError, TypeError, RuntimeError):
+        pass
+
+
+def _close_dendrite(dendrite):
+    """Close the dendrite's connection pool at interpreter exit."""
+    try:
+        dendrite.close_session()
+    except Exception:
+        pass
+
+
+@functools.lru_cache(maxsize=1)
+def get_bt_ctx():
+    """
+    Initialize and sync the process-wide Bittensor context.
+
+    Returns:
+        Tuple of (wallet, subtensor, metagraph, dendrite), created and synced
+        on first call and reused by every later caller. The dendrite session
+        is closed via atexit so its connection pool persists between tests.
+    """
+    wallet = bt.wallet(name=WALLET_NAME, hotkey=WALLET_HOTKEY)
+    subtensor = bt.subtensor(network=NETWORK)
+    metagraph = subtensor.metagraph(netuid=NETUID)
+    dendrite = bt.dendrite(wallet=wallet)
+
+    metagraph = _sync_or_load(metagraph, subtensor, NETUID)
+
+    _attach_persistent_session(dendrite)
+    atexit.register(_close_dendrite, dendrite)
+    return wallet, subtensor, metagraph, dendrite
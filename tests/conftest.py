@@ -0,0 +1,17 @@
+"""Shared pytest fixtures for the test suite."""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def bt_ctx():
+    """Process-wide Bittensor (wallet, subtensor, metagraph, dendrite)."""
+    from tests._bt_fixtures import get_bt_ctx
+    return get_bt_ctx()
+
+
+@pytest.fixture(scope="session")
+def sine_wav_bytes():
+    """The standard 440 Hz test tone, read from the on-disk fixture."""
+    from tests._audio_fixtures import create_test_audio
+    return create_test_audio()